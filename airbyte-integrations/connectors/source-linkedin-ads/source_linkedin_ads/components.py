@@ -4,12 +4,13 @@
 
 
 import datetime
-from collections import defaultdict
-from copy import deepcopy
+from copy import copy
 from dataclasses import dataclass, field
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from functools import lru_cache
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple, Union
 from urllib.parse import urlencode
 
+import orjson
 import pendulum
 import requests
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
@@ -31,11 +32,45 @@ from airbyte_cdk.sources.streams.core import StreamData
 from airbyte_cdk.sources.streams.http import HttpClient
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.http import BODY_REQUEST_METHODS
-from isodate import Duration, parse_duration
+from isodate import Duration
 
 from .utils import ANALYTICS_FIELDS_V2, FIELDS_CHUNK_SIZE, transform_data
 
 
+@lru_cache(maxsize=None)
+def _chunk_fields(fields: Tuple[str, ...], fields_chunk_size: int) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Splits the fields into chunks of `fields_chunk_size`, appending `dateRange` and `pivotValues` to every chunk.
+    The result only depends on the inputs, so it is computed once per distinct set of arguments.
+    """
+    chunks = []
+    for f in range(0, len(fields), fields_chunk_size):
+        chunk = fields[f : f + fields_chunk_size]
+        # Make sure base_fields are within the chunks
+        if "dateRange" not in chunk:
+            chunk += ("dateRange",)
+        if "pivotValues" not in chunk:
+            chunk += ("pivotValues",)
+        chunks.append(chunk)
+    return tuple(chunks)
+
+
+@lru_cache(maxsize=4096)
+def _to_rfc3339(value: str) -> str:
+    """
+    Converts an ISO8601 date-time string to RFC3339, assuming UTC for naive values.
+    The stdlib parser covers the formats returned by the API; anything it rejects falls back to pendulum.
+    Timestamps repeat a lot across records, so results are cached.
+    """
+    try:
+        parsed = datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        return pendulum.parse(value).to_rfc3339_string()
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.isoformat()
+
+
 class SafeHttpClient(HttpClient):
     """
     A custom HTTP client that safely validates query parameters, ensuring that the symbols ():,% are preserved
@@ -55,7 +90,8 @@ class SafeHttpClient(HttpClient):
         """
         Prepares an HTTP request with optional deduplication of query parameters and safe encoding.
         """
-        if dedupe_query_params:
+        # Only a URL that already carries a query string can duplicate the params, skip parsing it otherwise
+        if dedupe_query_params and "?" in url:
             query_params = self._dedupe_query_params(url, params)
         else:
             query_params = params or {}
@@ -128,59 +164,40 @@ class AnalyticsDatetimeBasedCursor(DatetimeBasedCursor):
 
     @staticmethod
     def chunk_analytics_fields(
-        fields: List = ANALYTICS_FIELDS_V2,
+        fields: Sequence[str] = ANALYTICS_FIELDS_V2,
         fields_chunk_size: int = FIELDS_CHUNK_SIZE,
-    ) -> Iterable[List]:
+    ) -> Iterable[Tuple[str, ...]]:
         """
         Chunks the list of available fields into smaller chunks, ensuring required fields are included.
         """
-
-        # Make chunks
-        chunks = list((fields[f : f + fields_chunk_size] for f in range(0, len(fields), fields_chunk_size)))
-
-        # Make sure base_fields are within the chunks
-        for chunk in chunks:
-            if "dateRange" not in chunk:
-                chunk.append("dateRange")
-            if "pivotValues" not in chunk:
-                chunk.append("pivotValues")
-        yield from chunks
+        yield from _chunk_fields(tuple(fields), fields_chunk_size)
 
     def _partition_daterange(
         self, start: datetime.datetime, end: datetime.datetime, step: Union[datetime.timedelta, Duration]
-    ) -> List[StreamSlice]:
+    ) -> Iterable[StreamSlice]:
         """
         Partitions a date range into slices, applying field chunking to ensure API constraints are respected.
+        Slices are yielded lazily as the date range is walked.
         """
         start_field = self._partition_field_start.eval(self.config)
         end_field = self._partition_field_end.eval(self.config)
-        dates = []
+        fields_strings = [",".join(fields_set) for fields_set in self.chunk_analytics_fields()]
         while start <= end:
             next_start = self._evaluate_next_start_date_safely(start, step)
             end_date = self._get_date(next_start - self._cursor_granularity, end, min)
-            date_slice_with_fields: List = []
-            for fields_set in self.chunk_analytics_fields():
-                date_range = {
-                    "start.day": start.day,
-                    "start.month": start.month,
-                    "start.year": start.year,
-                    "end.day": end_date.day,
-                    "end.month": end_date.month,
-                    "end.year": end_date.year,
-                }
-
-                fields = ",".join(fields_set)
-                date_slice_with_fields.append(
-                    {
-                        start_field: self._format_datetime(start),
-                        end_field: self._format_datetime(end_date),
-                        "fields": fields,
-                        **date_range,
-                    }
-                )
-            dates.append(StreamSlice(partition={}, cursor_slice={"field_date_chunks": date_slice_with_fields}))
+            base_cursor = {
+                start_field: self._format_datetime(start),
+                end_field: self._format_datetime(end_date),
+                "start.day": start.day,
+                "start.month": start.month,
+                "start.year": start.year,
+                "end.day": end_date.day,
+                "end.month": end_date.month,
+                "end.year": end_date.year,
+            }
+            date_slice_with_fields = [dict(base_cursor, fields=fields) for fields in fields_strings]
+            yield StreamSlice(partition={}, cursor_slice={"field_date_chunks": date_slice_with_fields})
             start = next_start
-        return dates
 
 
 @dataclass
@@ -194,16 +211,17 @@ class LinkedInAdsRecordExtractor(RecordExtractor):
         """
         Converts 'lastModified' and 'created' fields in the record to RFC3339 format.
         """
-        for item in ["lastModified", "created"]:
-            if record.get(item) is not None:
-                record[item] = pendulum.parse(record[item]).to_rfc3339_string()
+        for item in ("lastModified", "created"):
+            value = record.get(item)
+            if value is not None:
+                record[item] = _to_rfc3339(value)
         return record
 
-    def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
+    def extract_records(self, response: requests.Response) -> Iterable[Mapping[str, Any]]:
         """
         Extracts and transforms records from an HTTP response.
         """
-        for record in transform_data(response.json().get("elements")):
+        for record in transform_data(orjson.loads(response.content).get("elements")):
             yield self._date_time_to_rfc3339(record)
 
 
@@ -220,14 +238,18 @@ class LinkedInAdsCustomRetriever(SimpleRetriever):
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         """
-        Initializes the cursor and partition router for the retriever.
+        Initializes the cursor and partition router for the retriever, and builds the record transformations once
+        since they do not change between reads.
         """
         super().__post_init__(parameters)
         self.cursor = self._initialize_cursor()
+        self._apply_transformations()
 
     def _initialize_cursor(self):
         """
         Initializes the cursor for the retriever, supporting multiple partition routers.
+        Per-partition cursors are shallow copies of the stream slicer: the cursor state is rebound rather than mutated
+        in place, so each copy tracks its own state while sharing the immutable interpolation and config objects.
         """
         partition_router = (
             CartesianProductStreamSlicer(self.partition_router, parameters={})
@@ -237,7 +259,7 @@ class LinkedInAdsCustomRetriever(SimpleRetriever):
 
         return PerPartitionCursor(
             cursor_factory=CursorFactory(
-                lambda: deepcopy(self.stream_slicer),
+                lambda: copy(self.stream_slicer),
             ),
             partition_router=partition_router,
         )
@@ -256,14 +278,14 @@ class LinkedInAdsCustomRetriever(SimpleRetriever):
         """
         Reads and merges records for each field date chunk in the stream slice.
         """
-        merged_records = defaultdict(dict)
-
-        self._apply_transformations()
+        merged_records: MutableMapping[Tuple[str, Tuple[str, ...]], MutableMapping[str, Any]] = {}
 
         for field_slice in stream_slice.cursor_slice.get("field_date_chunks", []):
             updated_slice = StreamSlice(partition=stream_slice.partition, cursor_slice={**field_slice})
             for record in super().read_records(records_schema, stream_slice=updated_slice):
-                merged_records[f"{record['end_date']}-{record['pivotValues']}"].update(record)
+                # Merge from the underlying dict so `update` does not go through the Record mapping protocol key by key
+                data = record.data if isinstance(record, Record) else record
+                merged_records.setdefault((data["end_date"], tuple(data["pivotValues"])), {}).update(data)
 
         yield from merged_records.values()
 
@@ -3,7 +3,7 @@
 #
 
 import json
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
 
 import pendulum as pdm
 
@@ -13,7 +13,7 @@ import pendulum as pdm
 # expand this list, if required.
 DESTINATION_RESERVED_KEYWORDS: list = ["pivot"]
 # List of Reporting Metrics fields available for fetch
-ANALYTICS_FIELDS_V2: List = [
+ANALYTICS_FIELDS_V2: Tuple[str, ...] = (
     "actionClicks",
     "adUnitClicks",
     "approximateUniqueImpressions",
@@ -109,7 +109,7 @@ ANALYTICS_FIELDS_V2: List = [
     "viralVideoStarts",
     "viralVideoThirdQuartileCompletions",
     "viralVideoViews",
-]
+)
 FIELDS_CHUNK_SIZE = 18
 
 
@@ -2,6 +2,7 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
@@ -16,6 +17,7 @@ from source_linkedin_ads.components import (
     SafeEncodeHttpRequester,
     SafeHttpClient,
     StreamSlice,
+    _to_rfc3339,
 )
 
 logger = logging.getLogger("airbyte")
@@ -30,6 +32,7 @@ def mock_response():
             {"lastModified": "2024-09-02T00:00:00Z", "created": "2024-08-02T00:00:00Z", "data": "value2"},
         ]
     }
+    response.content = json.dumps(response.json.return_value).encode()
     return response
 
 
@@ -60,6 +63,28 @@ def test_safe_http_client_create_prepared_request():
     assert "key1=value1&key2=value2" in prepared_request.url
 
 
+@pytest.mark.parametrize(
+    "url, expected_url, dedupe_called",
+    [
+        ("http://example.com", "http://example.com/?key1=value1&key2=value2", False),
+        ("http://example.com?key1=value1", "http://example.com/?key1=value1&key2=value2", True),
+    ],
+)
+def test_safe_http_client_create_prepared_request_dedupe_query_params(mocker, url, expected_url, dedupe_called):
+    client = SafeHttpClient(name="test_client", logger=logger)
+    dedupe_query_params = mocker.spy(client, "_dedupe_query_params")
+
+    prepared_request = client._create_prepared_request(
+        http_method="GET",
+        url=url,
+        dedupe_query_params=True,
+        params={"key1": "value1", "key2": "value2"},
+    )
+
+    assert dedupe_query_params.called is dedupe_called
+    assert prepared_request.url == expected_url
+
+
 def test_safe_encode_http_requester_post_init():
     parameters = {"param1": "value1"}
     requester = SafeEncodeHttpRequester(
@@ -90,13 +115,25 @@ def test_analytics_datetime_based_cursor_partition_daterange(mock_analytics_curs
     end = datetime(2024, 9, 5)
     step = timedelta(days=2)
 
-    slices = cursor._partition_daterange(start=start, end=end, step=step)
+    slices = list(cursor._partition_daterange(start=start, end=end, step=step))
 
     assert len(slices) == 3
     for slice_ in slices:
         assert "field_date_chunks" in slice_.cursor_slice
 
 
+def test_analytics_datetime_based_cursor_partition_daterange_uses_chunk_analytics_fields(mock_analytics_cursor_params):
+    cursor = AnalyticsDatetimeBasedCursor(**mock_analytics_cursor_params)
+    cursor.chunk_analytics_fields = MagicMock(return_value=[("field1", "dateRange", "pivotValues"), ("field2", "dateRange", "pivotValues")])
+
+    slices = list(cursor._partition_daterange(start=datetime(2024, 9, 1), end=datetime(2024, 9, 1), step=timedelta(days=1)))
+
+    assert [chunk["fields"] for chunk in slices[0].cursor_slice["field_date_chunks"]] == [
+        "field1,dateRange,pivotValues",
+        "field2,dateRange,pivotValues",
+    ]
+
+
 def test_linkedin_ads_record_extractor_extract_records(mock_response):
     extractor = LinkedInAdsRecordExtractor()
     records = list(extractor.extract_records(response=mock_response))
@@ -107,6 +144,21 @@ def test_linkedin_ads_record_extractor_extract_records(mock_response):
         assert "created" in record
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-09-01T00:00:00Z", "2024-09-01T00:00:00+00:00"),
+        ("2024-09-01T00:00:00.123Z", "2024-09-01T00:00:00.123000+00:00"),
+        ("2024-09-01T10:00:00+02:00", "2024-09-01T10:00:00+02:00"),
+        ("2021-08-21 21:27:55", "2021-08-21T21:27:55+00:00"),
+        ("2021-08-21", "2021-08-21T00:00:00+00:00"),
+        ("20240901T100000Z", "2024-09-01T10:00:00+00:00"),
+    ],
+)
+def test_to_rfc3339(value, expected):
+    assert _to_rfc3339(value) == expected
+
+
 def test_linkedin_ads_custom_retriever_stream_slices(mock_retriever_params):
     retriever = LinkedInAdsCustomRetriever(**mock_retriever_params)
     slices = list(retriever.stream_slices())
@@ -114,6 +166,22 @@ def test_linkedin_ads_custom_retriever_stream_slices(mock_retriever_params):
     assert len(slices) > 0
 
 
+def test_linkedin_ads_custom_retriever_cursor_factory_creates_independent_cursors(mock_retriever_params):
+    stream_slicer = AnalyticsDatetimeBasedCursor(
+        start_datetime="2024-01-01", cursor_field="end_date", datetime_format="%Y-%m-%d", config={}, parameters={}
+    )
+    retriever = LinkedInAdsCustomRetriever(stream_slicer=stream_slicer, **mock_retriever_params)
+
+    first_cursor = retriever.cursor._cursor_factory.create()
+    second_cursor = retriever.cursor._cursor_factory.create()
+    first_cursor.set_initial_state({"end_date": "2024-02-01"})
+
+    assert first_cursor is not stream_slicer and second_cursor is not stream_slicer
+    assert first_cursor.get_stream_state() == {"end_date": "2024-02-01"}
+    assert second_cursor.get_stream_state() == {}
+    assert stream_slicer.get_stream_state() == {}
+
+
 def test_linkedin_ads_custom_retriever_read_records(mock_response, mock_retriever_params):
     retriever = LinkedInAdsCustomRetriever(**mock_retriever_params)
 